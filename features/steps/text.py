@@ -1,9 +1,13 @@
 """This module tests the Text class."""
 
+import re
 from behave import Given, When, Then
 import pygame
 from m1wengine.text import Text
 
+# matches each whole number in a position string such as "(12,34)"
+POSITION_PATTERN: re.Pattern = re.compile(r"\d+")
+
 
 @Given("pygame is initialized")
 def create_text(context: any):
@@ -30,7 +34,7 @@ def when_text(context: any, position: str, text: str):
     position: str
         the coordinates in a tuple as a string
     """
-    pos: list[int] = [int(i) for i in tuple(position) if i.isdigit()]
+    pos: list[int] = [int(i) for i in POSITION_PATTERN.findall(position)]
     x: int = pos[0]
     y: int = pos[1]
     context.created_text = Text(x, y, text)
@@ -39,6 +43,21 @@ def when_text(context: any, position: str, text: str):
     context.y = y
 
 
+@When("the text string is set to {text} again")
+def when_text_set_again(context: any, text: str):
+    """Set the text string of the created text.
+
+    Parameters
+    ----------
+    context: any
+        the retained context of this test
+    text: str
+        a string of the text to set on the object
+    """
+    context.previous_image = context.created_text.image
+    context.created_text.text_string = text
+
+
 @Then("the string is correct")
 def then_text(context: any):
     """Create text with a given string.
@@ -57,7 +76,7 @@ def then_text(context: any):
 
 
 @Then("the position is correct")
-def then_text(context: any):
+def then_position(context: any):
     """Create text with a given position.
 
     Parameters
@@ -73,3 +92,15 @@ def then_text(context: any):
     resulting_y: int = context.created_text.rect.y
     assert resulting_x == context.x
     assert resulting_y == context.y
+
+
+@Then("the text image is not rendered again")
+def then_text_not_rendered(context: any):
+    """Check the text image was kept when the string did not change.
+
+    Parameters
+    ----------
+    context: any
+        the retained context of this test
+    """
+    assert context.created_text.image is context.previous_image
@@ -4,3 +4,14 @@ Feature: Text objects
         When the word apple is created at position (0,0)
         Then the string is correct
         And the position is correct
+
+    Scenario: Setting a text object to the same string
+        Given pygame is initialized
+        When the word apple is created at position (0,0)
+        And the text string is set to apple again
+        Then the text image is not rendered again
+
+    Scenario: Creating a text object at a multi-digit position
+        Given pygame is initialized
+        When the word apple is created at position (12,345)
+        Then the position is correct
@@ -5,6 +5,7 @@ AbstractHud will need further definition in the client side code.
 import time
 import pygame
 from m1wengine.builders.hud_builder import HudBuilder
+from m1wengine.button import Button
 from abc import ABC, abstractmethod
 
 LEVEL_HINT_COORDINATES: pygame.Vector2 = pygame.Vector2(500, 400)
@@ -29,6 +30,8 @@ class AbstractHud(pygame.sprite.Group, ABC):
         Contains the level box sprite
     _level_hint_text: pygame.sprite.Sprite
         Contains the level hint prompt string
+    _active_sprites: list[pygame.sprite.Sprite]
+        The HUD sprites that define their own update method
 
     Methods
     -------
@@ -52,6 +55,14 @@ class AbstractHud(pygame.sprite.Group, ABC):
         Pause level value getter
     pause_level(self, new value: bool) -> None
         Pause level value setter
+    add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None)
+        Add a sprite to the HUD and track it if it needs updating
+    remove_internal(self, sprite: pygame.sprite.Sprite)
+        Remove a sprite from the HUD and stop tracking it
+    update(self) -> None
+        Update the active HUD sprites, sharing one mouse poll between buttons
+    draw(self, surface: pygame.Surface) -> None
+        Blit every HUD sprite onto a surface in a single batched call
     """
 
     def __init__(self):
@@ -63,6 +74,7 @@ class AbstractHud(pygame.sprite.Group, ABC):
         self._level_prompt_timer: int = 0
         self._level_box: pygame.sprite.Sprite = pygame.sprite.Sprite()
         self._level_hint_text: pygame.sprite.Sprite = pygame.sprite.Sprite()
+        self._active_sprites: list[pygame.sprite.Sprite] = []
 
     @abstractmethod
     def start_prompt_timer(self) -> None:
@@ -94,6 +106,67 @@ class AbstractHud(pygame.sprite.Group, ABC):
             self._level_hint_text.kill()
             self._level_hint_added_flag = False
 
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None) -> None:
+        """Add a sprite to the HUD and track it if it needs updating.
+
+        Static sprites such as Text labels and boxes keep the no-op update of
+        pygame.sprite.Sprite, so they are never tracked.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The sprite being added to the HUD
+        layer: int
+            Unused, kept for compatibility with pygame groups
+        """
+        if sprite not in self.spritedict:
+            if type(sprite).update is not pygame.sprite.Sprite.update:
+                self._active_sprites.append(sprite)
+        super().add_internal(sprite, layer)
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a sprite from the HUD and stop tracking it.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The sprite being removed from the HUD
+        """
+        if sprite in self._active_sprites:
+            self._active_sprites.remove(sprite)
+        super().remove_internal(sprite)
+
+    def update(self) -> None:
+        """Update the active HUD sprites.
+
+        Only sprites with their own update method are visited. The mouse is
+        polled once per frame and shared with every button.
+        """
+        mouse_position: tuple = pygame.mouse.get_pos()
+        mouse_buttons: tuple = pygame.mouse.get_pressed(num_buttons=3)
+        # copy the list, as a sprite may remove itself from the HUD in update
+        for sprite in self._active_sprites.copy():
+            if isinstance(sprite, Button):
+                sprite.update(mouse_position, mouse_buttons)
+            else:
+                sprite.update()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw all HUD sprites onto a surface.
+
+        All sprites are handed to pygame as a single blit sequence. The HUD is
+        never cleared sprite by sprite, so the returned dirty rects are skipped.
+
+        Parameters
+        ----------
+        surface: pygame.Surface
+            The surface to draw the HUD onto
+        """
+        blit_sequence: list[tuple[pygame.Surface, pygame.Rect]] = [
+            (sprite.image, sprite.rect) for sprite in self.spritedict
+        ]
+        surface.blits(blit_sequence, doreturn=False)
+
     def try_close_level_prompt(self) -> None:
         """Check if the prompt timer has ended."""
         current_time = int(time.perf_counter())
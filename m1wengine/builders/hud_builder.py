@@ -10,6 +10,11 @@ class HudBuilder(object):
 
     Class for holding all game score information.
 
+    Attributes
+    ----------
+    _box_surfaces: dict[tuple[int, int], pygame.Surface]
+        The background box surfaces already built, keyed by their size
+
     Methods
     -------
     __new__(cls)
@@ -32,10 +37,13 @@ class HudBuilder(object):
         Add a box to the HUD
     """
 
+    SCORE_BOX_DIMENSIONS: pygame.Vector2 = pygame.Vector2(150, 50)
     LEVEL_HINT_DIMENSIONS: pygame.Vector2 = pygame.Vector2(400, 50)
     PAUSE_BUTTON_DIMENSIONS: pygame.Vector2 = pygame.Vector2(50, 30)
 
     BOX_ALPHA: int = 100
+    # background box surfaces shared between boxes of the same size
+    _box_surfaces: dict[tuple[int, int], pygame.Surface] = {}
 
     SIDE_INDENT: int = 5
     LINE_INDENT: int = 20
@@ -68,34 +76,26 @@ class HudBuilder(object):
         score_sprite_list: list[pygame.sprite.Sprite]
             A list of all sprites in the score info section of the HUD
         """
-        SCORE_BOX_DIMENSIONS: pygame.Vector2 = pygame.Vector2(150, 50)
+        # read the layout values once and reuse them for every sprite
+        x: float = coordinates.x
+        y: float = coordinates.y
+        text_x: float = x + self.SIDE_INDENT
 
         score_sprite_list: list = []
 
         # define out box rect
-        score_rect: pygame.Rect = pygame.Rect(
-            coordinates.x,
-            coordinates.y,
-            SCORE_BOX_DIMENSIONS.x,
-            SCORE_BOX_DIMENSIONS.y,
-        )
+        score_rect: pygame.Rect = pygame.Rect((x, y), self.SCORE_BOX_DIMENSIONS)
 
         # add outer box
         score_sprite_list.append(self.add_box(score_rect))
 
         # define current score text
-        self._current_score_sprite: Text = Text(
-            coordinates.x + self.SIDE_INDENT,
-            coordinates.y,
-            "Current Score:",
-        )
+        self._current_score_sprite: Text = Text(text_x, y, "Current Score:")
         score_sprite_list.append(self._current_score_sprite)
 
         # define current boredom meter
         self._boredom_meter_spr: Text = Text(
-            coordinates.x + self.SIDE_INDENT,
-            coordinates.y + self.LINE_INDENT,
-            "Boredom Meter:",
+            text_x, y + self.LINE_INDENT, "Boredom Meter:"
         )
         score_sprite_list.append(self._boredom_meter_spr)
 
@@ -181,9 +181,17 @@ class HudBuilder(object):
          sprite: pygame.sprite.Sprite
             A background box sprite component of the HUD
         """
+        size: tuple[int, int] = (rect.width, rect.height)
+        box_surface: pygame.Surface = self._box_surfaces.get(size)
+        if box_surface is None:
+            # per pixel alpha, so the fill color carries the box transparency
+            box_surface = pygame.Surface(size, pygame.SRCALPHA)
+            box_color: pygame.Color = pygame.Color("grey")
+            box_color.a = self.BOX_ALPHA
+            box_surface.fill(box_color)
+            self._box_surfaces[size] = box_surface
+
         sprite: pygame.sprite.Sprite = pygame.sprite.Sprite()
         sprite.rect: pygame.rect.Rect = rect
-        sprite.image: pygame.surface.Surface = pygame.Surface((rect.width, rect.height))
-        sprite.image.fill(pygame.Color("grey"))
-        sprite.image.set_alpha(self.BOX_ALPHA)
+        sprite.image: pygame.surface.Surface = box_surface
         return sprite
@@ -34,12 +34,14 @@ class Button(pygame.sprite.Sprite):
         Object holding the Text
     __fill_colors: dict[str, str]
         What colors the button can have
+    __state_images: dict[str, pygame.Surface]
+        Pre-rendered button images for each fill color with the label applied
 
     Methods
     -------
     __init__(self)
         Initialize the button object
-    update(self)
+    update(self, mouse_position: tuple = None, mouse_buttons: tuple = None)
         Update the button state
     """
 
@@ -80,7 +82,6 @@ class Button(pygame.sprite.Sprite):
         self._on_click_function: callable = on_click_function
         self.__on_press: bool = one_press
         self.__already_pressed: bool = False
-        self.image: pygame.Surface = pygame.Surface((self.__width, self.__height))
         self.rect: pygame.Rect = pygame.Rect(
             self.__x, self.__y, self.__width, self.__height
         )
@@ -92,14 +93,36 @@ class Button(pygame.sprite.Sprite):
             "pressed": "#333333",
         }
 
-    def update(self):
-        """Update the state of the button as needed."""
-        mouse_position: tuple = pygame.mouse.get_pos()
-        self.image.fill(self.__fill_colors["normal"])
+        # the label never changes, so render it once for every button state
+        self.__state_images: dict[str, pygame.Surface] = {}
+        for state, color in self.__fill_colors.items():
+            state_image: pygame.Surface = pygame.Surface((self.__width, self.__height))
+            state_image.fill(color)
+            state_image.blit(self.__text.image, (0, 0))
+            self.__state_images[state] = state_image
+        self.image: pygame.Surface = self.__state_images["normal"]
+
+    def update(self, mouse_position: tuple = None, mouse_buttons: tuple = None):
+        """Update the state of the button as needed.
+
+        The mouse state is polled from pygame only when it is not passed in.
+
+        Parameters
+        ----------
+        mouse_position: tuple
+            The (x, y) position of the mouse this frame
+        mouse_buttons: tuple
+            The pressed state of the three mouse buttons this frame
+        """
+        if mouse_position is None:
+            mouse_position = pygame.mouse.get_pos()
+        state: str = "normal"
         if self.rect.collidepoint(mouse_position):
-            self.image.fill(self.__fill_colors["hover"])
-            if pygame.mouse.get_pressed(num_buttons=3)[0]:
-                self.image.fill(self.__fill_colors["pressed"])
+            state = "hover"
+            if mouse_buttons is None:
+                mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
+            if mouse_buttons[0]:
+                state = "pressed"
                 if self.__on_press:
                     self._on_click_function()
                 elif not self.__already_pressed:
@@ -107,5 +130,4 @@ class Button(pygame.sprite.Sprite):
                     self.__already_pressed = True
             else:
                 self.__already_pressed = False
-        self.__text.render_font()
-        self.image.blit(self.__text.image, (0, 0))
+        self.image = self.__state_images[state]
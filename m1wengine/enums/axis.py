@@ -0,0 +1,17 @@
+"""This module contains the Axis class."""
+from enum import IntEnum
+
+
+class Axis(IntEnum):
+    """Axis class which contains the enum of both movement axes.
+
+    Attributes
+    ----------
+    horizontal : int
+        the value representing the x axis
+    vertical : int
+        the value representing the y axis
+    """
+
+    horizontal = 0
+    vertical = 1
@@ -0,0 +1,38 @@
+"""This module contains the NPCStates class."""
+from enum import IntEnum, auto
+
+
+class NPCStates(IntEnum):
+    """NPCStates class which contains the enum of all NPC state machine states.
+
+    Attributes
+    ----------
+    Default: int
+        The value representing the intermediary state between states
+    Patrol: int
+        The value representing moving back and forth
+    Attack: int
+        The value representing moving towards a target
+    Flee: int
+        The value representing moving away from a target
+    Follow: int
+        The value representing moving behind a target
+    Thrown: int
+        The value representing being thrown by the player
+    Tracking: int
+        The value representing locking on to a target before a charge
+    Charging: int
+        The value representing charging at a target
+    Throw_Windup: int
+        The value representing waiting to be thrown by the player
+    """
+
+    Default = auto()
+    Patrol = auto()
+    Attack = auto()
+    Flee = auto()
+    Follow = auto()
+    Thrown = auto()
+    Tracking = auto()
+    Charging = auto()
+    Throw_Windup = auto()
@@ -14,8 +14,12 @@ class SpriteSheet:
         The background color for the sprite
     _sheet: pygame.Surface
         The animation sheet to display
+    _loaded_sheets: dict[str, pygame.Surface]
+        Every sheet loaded so far keyed by its path, shared by all sprite sheets
     """
 
+    _loaded_sheets: dict[str, pygame.Surface] = {}
+
     def __init__(
         self, image_path: str = None, color_key: pygame.Color | tuple = None
     ) -> None:
@@ -31,11 +35,16 @@ class SpriteSheet:
         else:
             self._color_key: pygame.Color = color_key
         if image_path:
-            try:
-                self._sheet: pygame.Surface = pygame.image.load(image_path).convert()
-            except pygame.error as e:
-                print(f"Unable to load spritesheet image: {image_path}")
-                raise SystemExit(e)
+            # sheets are only read from, so every entity can share one load
+            sheet: pygame.Surface = self._loaded_sheets.get(image_path)
+            if sheet is None:
+                try:
+                    sheet = pygame.image.load(image_path).convert()
+                except pygame.error as e:
+                    print(f"Unable to load spritesheet image: {image_path}")
+                    raise SystemExit(e)
+                self._loaded_sheets[image_path] = sheet
+            self._sheet: pygame.Surface = sheet
 
     def image_at(self, rectangle: tuple) -> pygame.Surface:
         """Load a specific image from a specific rectangle.
@@ -55,10 +64,10 @@ class SpriteSheet:
         ValueError: no sprite sheet was set, cannot get an image
         """
         # Loads image from x, y, x+offset, y+offset.
-        rect: pygame.Rect = pygame.Rect(rectangle)
-        image: pygame.Surface = pygame.Surface(rect.size)
         if self._sheet:
-            image.blit(self._sheet, (0, 0), rect)
+            # blit takes the rectangle as is, so no Rect is built per image
+            image: pygame.Surface = pygame.Surface((rectangle[2], rectangle[3]))
+            image.blit(self._sheet, (0, 0), rectangle)
             image.set_colorkey(self._color_key)
             return image
         else:
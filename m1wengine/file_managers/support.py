@@ -4,6 +4,9 @@ from os import walk
 import pygame
 from m1wengine.settings import TILESIZE
 
+# tilesets cut so far keyed by path, the tiles are only read from so they are shared
+_cut_graphics: dict[str, list[pygame.Surface]] = {}
+
 
 def import_csv_layout(path: str) -> list[int]:
     """Read in csv values into an array.
@@ -46,6 +49,8 @@ def import_folder(path: str) -> None:
 def import_cut_graphic(path: str) -> list[pygame.Surface]:
     """Cut a tileset into correct sprites.
 
+    Each tileset is only loaded and cut once, later calls reuse its tiles.
+
     Parameters
     ----------
     path: str
@@ -56,17 +61,21 @@ def import_cut_graphic(path: str) -> list[pygame.Surface]:
     list[pygame.Surface]
         The list of images extracted from a larger image
     """
-    surface: pygame.Surface = pygame.image.load(path).convert_alpha()
-    tile_num_x: int = int(surface.get_size()[0] / TILESIZE)
-    tile_num_y: int = int(surface.get_size()[1] / TILESIZE)
+    cut_tiles: list[pygame.Surface] = _cut_graphics.get(path)
+    if cut_tiles is None:
+        surface: pygame.Surface = pygame.image.load(path).convert_alpha()
+        tile_num_x: int = int(surface.get_size()[0] / TILESIZE)
+        tile_num_y: int = int(surface.get_size()[1] / TILESIZE)
 
-    cut_tiles: list = []
-    for row in range(tile_num_y):
-        for col in range(tile_num_x):
-            x: int = col * TILESIZE
-            y: int = row * TILESIZE
-            new_surface: pygame.Surface = pygame.Surface((TILESIZE, TILESIZE))
-            new_rect: pygame.Rect = pygame.Rect(x, y, TILESIZE, TILESIZE)
-            new_surface.blit(surface, (0, 0), new_rect)
-            cut_tiles.append(new_surface)
-    return cut_tiles
+        cut_tiles = []
+        for row in range(tile_num_y):
+            for col in range(tile_num_x):
+                x: int = col * TILESIZE
+                y: int = row * TILESIZE
+                new_surface: pygame.Surface = pygame.Surface((TILESIZE, TILESIZE))
+                new_rect: pygame.Rect = pygame.Rect(x, y, TILESIZE, TILESIZE)
+                new_surface.blit(surface, (0, 0), new_rect)
+                cut_tiles.append(new_surface)
+        _cut_graphics[path] = cut_tiles
+    # callers get their own list, only the surfaces are shared
+    return list(cut_tiles)
@@ -1,6 +1,7 @@
 """This module contains the CameraManager class."""
 import pygame
 from m1wengine.tiles.entities.characters.player import Player
+from m1wengine.tiles.tile import Tile
 
 
 class CameraManager(pygame.sprite.Group):
@@ -20,11 +21,21 @@ class CameraManager(pygame.sprite.Group):
         The offset at which to render all sprites
     _player_character: Player
         The currently shown frame represented by an index
+    _camera_anchor: Tile
+        A tile outside of any group that tracks the camera's own movement
+    _static_surface: pygame.Surface
+        The pre-rendered images of every static sprite, drawn before the group
+    _static_rect: pygame.Rect
+        The on screen area covered by the static surface
 
     Methods
     -------
     camera_update(self)
         Renders all sprites relative to the player character position
+    add_static(self, *sprites: pygame.sprite.Sprite)
+        Render sprites that never change into the static layer
+    draw(self, surface: pygame.Surface) -> list[pygame.Rect]
+        Draw the static layer and then every camera sprite
     """
 
     def __init__(self, player_character: Player) -> None:
@@ -39,33 +50,114 @@ class CameraManager(pygame.sprite.Group):
             The player character that entities move around
         """
         super().__init__()
-        surface_x: int = 0
-        surface_y: int = 1
-        display_surface: pygame.Surface = pygame.display.get_surface()
-        self._half_width: int = (
-            display_surface.get_size()[surface_x] // 2
-        )  # floor division, returns int
-        self._half_height: int = (
-            display_surface.get_size()[surface_y] // 2
-        )  # floor division, returns int
+        display_width, display_height = pygame.display.get_surface().get_size()
+        # floor division, returns int
+        self._half_width: int = display_width // 2
+        self._half_height: int = display_height // 2
 
         self._offset: pygame.math.Vector2 = pygame.math.Vector2()
         self._player_character: Player = player_character
+        self._camera_anchor: Tile = Tile(())
+        self._static_surface: pygame.Surface = None
+        self._static_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
 
     def camera_update(self) -> None:
         """Update the camera sprites.
 
-        This method will set the direction of camera sprites to be the
-        opposite direction of the player's heading.
+        This method will move the camera in the opposite direction of the
+        player's heading and shift every camera sprite by the same amount.
         Note that non-player entities will move at a slower speed than the player
         due to being moved in the opposite direction of the player at the
         player's speed.
         """
-        for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
-            # offset = sprite.rect.topleft - self.offset
-            previous_direction: pygame.math.Vector2 = sprite.compass.copy()
-            sprite.compass = self._player_character.compass.copy() * -1
-            sprite.move(self._player_character.speed)
-            sprite.compass = pygame.math.Vector2(
-                previous_direction.x, previous_direction.y
+        # the camera shift is the same for every sprite, so compute it once
+        player_character: Player = self._player_character
+        camera_anchor: Tile = self._camera_anchor
+        anchor_rect: pygame.Rect = camera_anchor.rect
+        previous_position: tuple[int, int] = anchor_rect.topleft
+        # point the anchor opposite the player in place, without a new Vector2
+        player_compass: pygame.math.Vector2 = player_character.compass
+        camera_anchor.compass.update(-player_compass.x, -player_compass.y)
+        camera_anchor.move(player_character.speed)
+        camera_shift: tuple[int, int] = (
+            anchor_rect.x - previous_position[0],
+            anchor_rect.y - previous_position[1],
+        )
+        if camera_shift == (0, 0):
+            return
+        self._offset += camera_shift
+        self._static_rect.move_ip(camera_shift)
+
+        # every sprite shifts by the same amount, so the order does not matter
+        for sprite in self.spritedict:
+            sprite.move_and_update_hitbox(camera_shift)
+
+    def add_static(self, *sprites: pygame.sprite.Sprite) -> None:
+        """Render sprites that never change into the static layer.
+
+        The sprites are drawn once into a single surface that moves with the
+        camera, and are not added to the group. Their own rects are no longer
+        moved by the camera, so only sprites that never move, animate or collide,
+        like terrain, should be added. The static layer is drawn before every
+        camera sprite.
+
+        Parameters
+        ----------
+        sprites: pygame.sprite.Sprite
+            The sprites, or groups of sprites, to render into the static layer
+        """
+        # a temporary group flattens nested groups and keeps their order
+        static_sprites: list[pygame.sprite.Sprite] = pygame.sprite.Group(
+            *sprites
+        ).sprites()
+        if not static_sprites:
+            return
+
+        static_rects: list[pygame.Rect] = [sprite.rect for sprite in static_sprites]
+        if self._static_surface is not None:
+            static_rects.append(self._static_rect)
+        layer_rect: pygame.Rect = static_rects[0].unionall(static_rects[1:])
+
+        # sprites not covering the whole area must leave the gaps transparent
+        layer: pygame.Surface = pygame.Surface(
+            layer_rect.size, pygame.SRCALPHA
+        ).convert_alpha()
+        layer.fill((0, 0, 0, 0))
+        if self._static_surface is not None:
+            layer.blit(
+                self._static_surface,
+                (
+                    self._static_rect.x - layer_rect.x,
+                    self._static_rect.y - layer_rect.y,
+                ),
             )
+        layer.blits(
+            [
+                (
+                    sprite.image,
+                    (sprite.rect.x - layer_rect.x, sprite.rect.y - layer_rect.y),
+                )
+                for sprite in static_sprites
+            ],
+            doreturn=False,
+        )
+
+        self._static_surface = layer
+        self._static_rect = layer_rect
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """Draw the static layer and then every camera sprite.
+
+        Parameters
+        ----------
+        surface: pygame.Surface
+            The surface to draw onto
+
+        Returns
+        -------
+        dirty: list[pygame.Rect]
+            The areas cleared by sprites removed since the last draw
+        """
+        if self._static_surface is not None:
+            surface.blit(self._static_surface, self._static_rect)
+        return super().draw(surface)
@@ -0,0 +1,119 @@
+"""This module contains the EntityManager class."""
+import pygame
+
+
+class EntityManager(pygame.sprite.Group):
+    """Entity Manager class.
+
+    A sprite group that keeps its members and their hitboxes in parallel lists.
+    The lists are only rebuilt when the group membership changes, so every entity
+    scanning the group in a frame shares the same data instead of rebuilding it.
+
+    Attributes
+    ----------
+    _sprite_list: list[pygame.sprite.Sprite]
+        The cached list of sprites in the group
+    _hitbox_list: list[pygame.Rect]
+        The cached hitboxes, where index i belongs to _sprite_list[i]
+    _lists_dirty: bool
+        Flag representing if the cached lists must be rebuilt
+
+    Methods
+    -------
+    add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None)
+        Add a sprite to the group and invalidate the cached lists
+    remove_internal(self, sprite: pygame.sprite.Sprite)
+        Remove a sprite from the group and invalidate the cached lists
+    sprite_list(self) -> list[pygame.sprite.Sprite]
+        Get the cached list of sprites
+    hitbox_list(self) -> list[pygame.Rect]
+        Get the cached list of sprite hitboxes
+    group_lists(group: pygame.sprite.Group) -> tuple[list, list]
+        Get the sprite and hitbox lists of any sprite group
+    """
+
+    def __init__(self, *sprites: pygame.sprite.Sprite) -> None:
+        """Construct an EntityManager.
+
+        Parameters
+        ----------
+        sprites: pygame.sprite.Sprite
+            Any sprites to add to the group on creation
+        """
+        self._sprite_list: list[pygame.sprite.Sprite] = []
+        self._hitbox_list: list[pygame.Rect] = []
+        self._lists_dirty: bool = True
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None) -> None:
+        """Add a sprite to the group and invalidate the cached lists.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The sprite being added to the group
+        layer: int
+            Unused, kept for compatibility with pygame groups
+        """
+        super().add_internal(sprite, layer)
+        self._lists_dirty = True
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a sprite from the group and invalidate the cached lists.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The sprite being removed from the group
+        """
+        super().remove_internal(sprite)
+        self._lists_dirty = True
+
+    @property
+    def sprite_list(self) -> list[pygame.sprite.Sprite]:
+        """Get the cached list of sprites.
+
+        The returned list is shared and must not be modified by the caller.
+        """
+        if self._lists_dirty:
+            self._rebuild_lists()
+        return self._sprite_list
+
+    @property
+    def hitbox_list(self) -> list[pygame.Rect]:
+        """Get the cached list of sprite hitboxes.
+
+        The returned list is shared and must not be modified by the caller.
+        """
+        if self._lists_dirty:
+            self._rebuild_lists()
+        return self._hitbox_list
+
+    def _rebuild_lists(self) -> None:
+        """Rebuild the cached sprite and hitbox lists from the group."""
+        self._sprite_list = self.sprites()
+        self._hitbox_list = [sprite._hitbox for sprite in self._sprite_list]
+        self._lists_dirty = False
+
+    @staticmethod
+    def group_lists(
+        group: pygame.sprite.Group,
+    ) -> tuple[list[pygame.sprite.Sprite], list[pygame.Rect]]:
+        """Get the sprite and hitbox lists of any sprite group.
+
+        An EntityManager returns its cached lists, any other group has them built.
+
+        Parameters
+        ----------
+        group: pygame.sprite.Group
+            The sprite group to get the lists of
+
+        Returns
+        -------
+        lists: tuple[list[pygame.sprite.Sprite], list[pygame.Rect]]
+            The sprites of the group and their matching hitboxes
+        """
+        if isinstance(group, EntityManager):
+            return group.sprite_list, group.hitbox_list
+        sprite_list: list[pygame.sprite.Sprite] = group.sprites()
+        return sprite_list, [sprite._hitbox for sprite in sprite_list]
@@ -0,0 +1,180 @@
+"""This module contains the ObstacleManager class."""
+import pygame
+
+# width and height in pixels of one spatial hash cell
+DEFAULT_CELL_SIZE: int = 64
+
+
+class ObstacleManager(pygame.sprite.Group):
+    """Obstacle Manager class.
+
+    A sprite group for static obstacles that indexes its members in a spatial
+    hash grid, so collision checks only test the obstacles near a rect.
+
+    Obstacles may be moved by the camera, but must keep their positions relative
+    to each other. The grid is built relative to an anchor sprite, and the
+    anchor's movement is used to translate queries into grid space. The grid is
+    only rebuilt when the group membership changes.
+
+    Attributes
+    ----------
+    _cell_size: int
+        The width and height in pixels of one grid cell
+    _cells: dict[tuple[int, int], list[int]]
+        The sprite indices overlapping each (column, row) grid cell
+    _sprite_list: list[pygame.sprite.Sprite]
+        The cached list of sprites in the group
+    _anchor: pygame.sprite.Sprite
+        The sprite used to measure how far the obstacles moved since the build
+    _anchor_origin: tuple[int, int]
+        The position of the anchor when the grid was built
+    _grid_dirty: bool
+        Flag representing if the grid must be rebuilt
+
+    Methods
+    -------
+    add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None)
+        Add a sprite to the group and invalidate the grid
+    remove_internal(self, sprite: pygame.sprite.Sprite)
+        Remove a sprite from the group and invalidate the grid
+    candidates(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]
+        Get the sprites sharing a grid cell with a rect
+    """
+
+    def __init__(
+        self, *sprites: pygame.sprite.Sprite, cell_size: int = DEFAULT_CELL_SIZE
+    ) -> None:
+        """Construct an ObstacleManager.
+
+        Parameters
+        ----------
+        sprites: pygame.sprite.Sprite
+            Any sprites to add to the group on creation
+        cell_size: int
+            The width and height in pixels of one grid cell
+
+        Raises
+        ------
+        ValueError: cell_size must be greater than 0
+        """
+        if cell_size <= 0:
+            raise ValueError("ERROR: cell_size must be greater than 0.")
+        self._cell_size: int = cell_size
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._sprite_list: list[pygame.sprite.Sprite] = []
+        self._anchor: pygame.sprite.Sprite = None
+        self._anchor_origin: tuple[int, int] = (0, 0)
+        self._grid_dirty: bool = True
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None) -> None:
+        """Add a sprite to the group and invalidate the grid.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The sprite being added to the group
+        layer: int
+            Unused, kept for compatibility with pygame groups
+        """
+        super().add_internal(sprite, layer)
+        self._grid_dirty = True
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a sprite from the group and invalidate the grid.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The sprite being removed from the group
+        """
+        super().remove_internal(sprite)
+        self._grid_dirty = True
+
+    def candidates(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Get the sprites sharing a grid cell with a rect.
+
+        Every sprite whose rect collides with the given rect is returned, along
+        with nearby sprites that do not. Sprites keep their group order.
+
+        Parameters
+        ----------
+        rect: pygame.Rect
+            The rect to find nearby sprites for
+
+        Returns
+        -------
+        candidates: list[pygame.sprite.Sprite]
+            The sprites in the grid cells the rect overlaps
+        """
+        if self._grid_dirty:
+            self._rebuild_grid()
+        if not self._sprite_list:
+            return []
+
+        # translate the rect back into the space the grid was built in
+        anchor_rect: pygame.Rect = self._anchor.rect
+        shift_x: int = anchor_rect.x - self._anchor_origin[0]
+        shift_y: int = anchor_rect.y - self._anchor_origin[1]
+        first_column, last_column, first_row, last_row = self._cell_span(
+            rect.x - shift_x, rect.y - shift_y, rect.width, rect.height
+        )
+
+        cells: dict[tuple[int, int], list[int]] = self._cells
+        indices: set[int] = set()
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell: list[int] = cells.get((column, row))
+                if cell:
+                    indices.update(cell)
+
+        sprite_list: list[pygame.sprite.Sprite] = self._sprite_list
+        return [sprite_list[index] for index in sorted(indices)]
+
+    def _cell_span(self, x: int, y: int, width: int, height: int) -> tuple:
+        """Get the first and last grid columns and rows an area overlaps.
+
+        Parameters
+        ----------
+        x: int
+            The left edge of the area
+        y: int
+            The top edge of the area
+        width: int
+            The width of the area
+        height: int
+            The height of the area
+
+        Returns
+        -------
+        span: tuple[int, int, int, int]
+            The first column, last column, first row and last row
+        """
+        cell_size: int = self._cell_size
+        # rects do not collide on their right and bottom edges
+        return (
+            x // cell_size,
+            (x + max(width, 1) - 1) // cell_size,
+            y // cell_size,
+            (y + max(height, 1) - 1) // cell_size,
+        )
+
+    def _rebuild_grid(self) -> None:
+        """Rebuild the spatial hash grid from the group."""
+        self._sprite_list = self.sprites()
+        self._cells = {}
+        self._grid_dirty = False
+        if not self._sprite_list:
+            self._anchor = None
+            return
+
+        self._anchor = self._sprite_list[0]
+        self._anchor_origin = self._anchor.rect.topleft
+        for index, sprite in enumerate(self._sprite_list):
+            rect: pygame.Rect = sprite.rect
+            first_column, last_column, first_row, last_row = self._cell_span(
+                rect.x, rect.y, rect.width, rect.height
+            )
+            for column in range(first_column, last_column + 1):
+                for row in range(first_row, last_row + 1):
+                    self._cells.setdefault((column, row), []).append(index)
@@ -54,7 +54,11 @@ class Text(pygame.sprite.Sprite):
         new_value: int
             New incoming value to set
         """
-        self._text = str(new_value)
+        new_text: str = str(new_value)
+        # only re-render the font when the text actually changes
+        if new_text == self._text:
+            return
+        self._text = new_text
         self.render_font()
 
     def render_font(self) -> None:
@@ -1,14 +1,16 @@
 """This module contains the Entity class."""
 
-from enum import Enum
 import math
 import sys
 import time
 from typing import Callable
 import pygame
 from m1wengine.enums.actions import Actions
+from m1wengine.enums.axis import Axis
 from m1wengine.enums.eaten_powers import EatenPowers
 from m1wengine.enums.direction import Direction
+from m1wengine.enums.npc_states import NPCStates
+from m1wengine.managers.entity_manager import EntityManager
 from m1wengine.managers.level_manager import LevelManager
 from m1wengine.tiles.entities.characters.player import Player
 from m1wengine.tiles.entities.characters.character import Character
@@ -27,10 +29,12 @@ class NPC(Character):
     ----------
     _player: Character
         The player's character, tracked by each NPC
-    _states: Enum
+    _states: type[NPCStates]
         The state machine for automated movement
-    _current_state: states
+    _current_state: NPCStates
         The current NPC state
+    _state_movements: dict[NPCStates, Callable]
+        The movement method to call for each state
     _initial_charge_compass: pygame.math.Vector2
         The vector of where we start the charge
     _hud: HeadsUpDisplay
@@ -47,10 +51,14 @@ class NPC(Character):
         The starting time in seconds when tracking a target sprite
     _initial_charge_time: int
         The starting time in seconds when beginning a charge move
-    _last_time_stored: int
+    _last_time_stored: float
         The last time an automated state used a timer
     _radar: pygame.Rect
         The inflated rectangle used to detect other nearby Characters
+    _radar_sprites: list[pygame.sprite.Sprite]
+        The sprites found on radar by the last sprite group scan
+    _flipped_images: dict[pygame.Surface, pygame.Surface]
+        The 180 degree rotation of each image flipped so far, shared by all NPCs
 
     Methods
     -------
@@ -91,7 +99,12 @@ class NPC(Character):
         Charge self from current position at target sprite
     reset_charge_variables(self)
         Reset all variables relating to charge logic back to defaults
-    is_timer_finished(self, initial_timer: int, timer_threshold_seconds: int) -> bool
+    is_timer_finished(
+        self,
+        initial_timer: int,
+        timer_threshold_seconds: int,
+        current_time: float = None,
+    ) -> bool
         Check if timer has reached a threshold
     charged_into_obstacle(self) -> bool
         Check if obstacle sprite collision detected
@@ -127,7 +140,7 @@ class NPC(Character):
         Determine if another sprite is facing towards this sprite
     collision_set_compass(self, collided_coords: tuple)
         Set the compass away from the direction of the collision
-    teleport_out_of_sprite(self, collision_rect: pygame.Rect)
+    teleport_out_of_sprite(self, collision_rect: pygame.Rect, axis: Axis = None)
         Teleport out of a collided wall - NPC specific
     flip_current_image(self)
         Flip the current image
@@ -136,6 +149,12 @@ class NPC(Character):
     # default speed values used for movement in state machine
     DEFAULT_SPEED_FAST: int = 30
     DEFAULT_SPEED_ZERO: int = 0
+    # how far the radar reaches past the NPC rect on each axis, in pixels
+    # TODO: find sweet spot inflation size for radar detection
+    RADAR_INFLATION: tuple[int, int] = (TILESIZE * 8, TILESIZE * 8)
+
+    _states: type[NPCStates] = NPCStates
+    _flipped_images: dict[pygame.Surface, pygame.Surface] = {}
 
     def __init__(
         self,
@@ -166,21 +185,17 @@ class NPC(Character):
         self._player: Player = pygame.sprite.Sprite()
 
         # setting up state machine
-        self._states: Enum = Enum(
-            "states",
-            [
-                "Default",
-                "Patrol",
-                "Attack",
-                "Flee",
-                "Follow",
-                "Thrown",
-                "Tracking",
-                "Charging",
-                "Throw_Windup",
-            ],
-        )
-        self._current_state: Enum = self._states.Patrol
+        self._current_state: NPCStates = NPCStates.Patrol
+        self._state_movements: dict[NPCStates, Callable] = {
+            NPCStates.Default: self.default_movement,
+            NPCStates.Attack: self.attack_movement,
+            NPCStates.Flee: self.flee_movement,
+            NPCStates.Patrol: self.patrol_movement,
+            NPCStates.Follow: self.follow_movement,
+            NPCStates.Throw_Windup: self.throw_windup_movement,
+            NPCStates.Thrown: self.thrown_movement,
+            NPCStates.Tracking: self.tracking_movement,
+        }
         self._initial_charge_compass: pygame.math.Vector2 = pygame.math.Vector2(0, 0)
 
         # the closest sprite on our radar
@@ -196,14 +211,12 @@ class NPC(Character):
         self._initial_tracking_time_seconds: int = self.DEFAULT_TIMER_VALUE
         self._initial_charge_time_seconds: int = self.DEFAULT_TIMER_VALUE
 
-        # for automated movements, store a previous timestamp
-        self._last_time_stored: int = 0
+        # for automated movements, store a previous timestamp, starting at spawn
+        self._last_time_stored: float = time.perf_counter()
 
-        # TODO: find sweet spot inflation size for radar detection
-        inflation_size: int = 8
-        self._radar: pygame.Rect = self.rect.inflate(
-            TILESIZE * inflation_size, TILESIZE * inflation_size
-        )
+        self._radar: pygame.Rect = self.rect.inflate(self.RADAR_INFLATION)
+        # broad phase for collision checks against the last scanned group
+        self._radar_sprites: list[pygame.sprite.Sprite] = []
         self._player_collision_resolved = True
         self._hud = None
 
@@ -288,22 +301,22 @@ class NPC(Character):
         is_player: bool = entities.__class__.__name__ == "Player"
 
         if is_player:
-            # if is_player, then entities is a single sprite
-            entity_rect_list: list[pygame.sprite.Sprite] = entities
-            collisions: bool = self._radar.colliderect(entity_rect_list)
+            # if is_player, then entities is a single sprite, pass its rect
+            # directly rather than having pygame look up the rect attribute
+            player_rect: pygame.Rect = entities.rect
+            collisions: bool = self._radar.colliderect(player_rect)
         else:
-            # sprites as a list of sprites, not a Group of sprites
-            sprite_group_list: list[pygame.sprite.Sprite] = pygame.sprite.Group.sprites(
-                entities
-            )
-            hitbox_list: list[pygame.Rect] = [
-                sprite._hitbox for sprite in sprite_group_list
-            ]
+            # lists are shared by every NPC scanning an EntityManager in a frame
+            sprite_group_list: list[pygame.sprite.Sprite]
+            hitbox_list: list[pygame.Rect]
+            sprite_group_list, hitbox_list = EntityManager.group_lists(entities)
             # list of all NPC collisions
             collisions: bool = self._radar.collidelistall(hitbox_list)
+            self._radar_sprites = [sprite_group_list[i] for i in collisions]
 
+        current_state: NPCStates = self._current_state
         # if there is an entity inside our radar
-        if collisions and self._current_state != self._states.Thrown:
+        if collisions and current_state != NPCStates.Thrown:
             if not is_player:
                 self.set_target_sprite_from_list(sprite_group_list, collisions)
             else:
@@ -311,23 +324,23 @@ class NPC(Character):
 
             # try to attack
             if set_active_state == self.set_state_attack:
-                if self._current_state != self._states.Attack:
+                if current_state != NPCStates.Attack:
                     set_active_state()
             # try to flee
             elif set_active_state == self.set_state_flee:
-                if self._current_state != self._states.Flee:
+                if current_state != NPCStates.Flee:
                     set_active_state()
             # try to follow
             elif set_active_state == self.set_state_follow:
-                if self._current_state != self._states.Follow:
+                if current_state != NPCStates.Follow:
                     set_active_state()
             # try to track
             elif set_active_state == self.set_state_track:
-                if self._current_state != self._states.Tracking:
+                if current_state != NPCStates.Tracking:
                     set_active_state()
             # try to charge
             elif set_active_state == self.set_state_charge:
-                if self._current_state != self._states.Charging:
+                if current_state != NPCStates.Charging:
                     set_active_state()
             # cannot try to patrol as an active state
             elif set_active_state == self.set_state_patrol:
@@ -347,19 +360,18 @@ class NPC(Character):
         collisions: list[int]
             List of indices for which sprites have collided
         """
+        # squared distances keep the same order as distances without a sqrt
         current_min_distance: float = float(sys.maxsize)
         index_of_closest: int = -1
 
         for collision_index in collisions:
             # get the coordinates of detected sprite
             coord: tuple = sprite_group_list[collision_index].rect.center
-            # distance between self and the entity on radar
-            distance: float = self.get_distance(coord)
-            # track if entity is closest to self
-            old_min: float = current_min_distance
-            current_min_distance = min(distance, current_min_distance)
+            # squared distance between self and the entity on radar
+            distance: int = self.get_distance_squared(coord)
             # if current entity on radar is new closest entity
-            if current_min_distance < old_min:
+            if distance < current_min_distance:
+                current_min_distance = distance
                 index_of_closest = collision_index
 
         # set target sprite to closest sprite IF something detected
@@ -369,32 +381,12 @@ class NPC(Character):
 
     def move_based_on_state(self) -> None:
         """Logic to determine which _movement() method to call."""
-        if self._current_state == self._states.Default:
-            self.default_movement()
-
-        elif self._current_state == self._states.Attack:
-            self.attack_movement()
-
-        elif self._current_state == self._states.Flee:
-            self.flee_movement()
-
-        elif self._current_state == self._states.Patrol:
-            self.patrol_movement()
-
-        elif self._current_state == self._states.Follow:
-            self.follow_movement()
-
-        elif self._current_state == self._states.Throw_Windup:
-            self.throw_windup_movement()
-
-        elif self._current_state == self._states.Thrown:
-            self.thrown_movement()
-
-        elif self._current_state == self._states.Tracking:
-            self.tracking_movement()
+        movement: Callable = self._state_movements.get(self._current_state)
+        if movement is not None:
+            movement()
 
         # separate conditional because tracking may be over
-        if self._current_state == self._states.Charging:
+        if self._current_state == NPCStates.Charging:
             self.charge_movement()
 
     def default_movement(self) -> None:
@@ -409,13 +401,17 @@ class NPC(Character):
         if self.speed != Tile.DEFAULT_SPEED:
             self.speed = Tile.DEFAULT_SPEED
 
-        if self.is_timer_finished(self._last_time_stored, timer_threshold_seconds=3):
-            # 10 seconds passed
-            if self.compass.x != 1 or self.compass.x != 1:
-                self.compass.x = 1
-            else:
-                self.compass.x *= -1
-            self.compass.y = 0
+        # read the clock once per tick and share it with the timer check
+        if self.is_timer_finished(
+            self._last_time_stored,
+            timer_threshold_seconds=3,
+            current_time=current_time_in_seconds,
+        ):
+            # 3 seconds passed, turn around and walk straight the other way
+            compass: pygame.math.Vector2 = self.compass
+            compass.update(
+                Direction.left if compass.x > 0 else Direction.right, Direction.stop
+            )
             self._last_time_stored = current_time_in_seconds
 
         self.collision_handler()
@@ -424,8 +420,8 @@ class NPC(Character):
     def flee_movement(self) -> None:
         """Change direction based on where target is."""
         if self.facing_towards_entity(self._target_sprite):
-            # must set to copy or it gives the entity a shared compass
-            self.compass = self._target_sprite.compass.copy()
+            # copy into our own compass so the entity does not share a compass
+            self.compass.update(self._target_sprite.compass)
             self.collision_handler()
 
         # move according to the compass direction
@@ -444,7 +440,7 @@ class NPC(Character):
         """Get thrown from current position."""
         # if NPC is thrown long enough. TODO: make far enough (number of tiles)
         if self.is_timer_finished(self._last_time_stored, timer_threshold_seconds=1):
-            self._current_state = self._states.Patrol
+            self._current_state = NPCStates.Patrol
             self.speed = self.DEFAULT_SPEED
         else:
             collision_dictionary: dict = self.collision_detection(
@@ -470,7 +466,7 @@ class NPC(Character):
             self.speed = self.DEFAULT_SPEED_ZERO
         # rotate compass to target sprite
         self.rotate_compass_to_target_sprite()
-        self._initial_charge_compass = self.compass.copy()
+        self._initial_charge_compass.update(self.compass)
 
         # check if any good_sprites are on the tracker's radar
         collision_dictionary: dict = self.collision_detection(
@@ -495,7 +491,7 @@ class NPC(Character):
     def charge_movement(self) -> None:
         """Charge from current position until charge is disrupted."""
         # protect compass to prevent it from being overwritten
-        self.compass = self._initial_charge_compass.copy()
+        self.compass.update(self._initial_charge_compass)
 
         # if first loop, set _initial_charge_time
         if self._initial_charge_time == self.DEFAULT_TIMER_VALUE:
@@ -525,7 +521,10 @@ class NPC(Character):
         self._initial_charge_time_seconds = self.DEFAULT_TIMER_VALUE
 
     def is_timer_finished(
-        self, initial_timer: int, timer_threshold_seconds: int
+        self,
+        initial_timer: int,
+        timer_threshold_seconds: int,
+        current_time: float = None,
     ) -> bool:
         """Check that a time has elapsed based on current_time.
 
@@ -535,6 +534,8 @@ class NPC(Character):
             The initial time, in seconds
         timer_threshold_seconds: int
             Number to seconds to be added to initial timer
+        current_time: float
+            The current time in seconds, read from the clock when not provided
 
         Raises
         ------
@@ -544,7 +545,9 @@ class NPC(Character):
         if initial_timer == self.DEFAULT_TIMER_VALUE:
             raise ValueError("ERROR: initial timer still set to default.")
         # get current time
-        current_time = int(time.perf_counter())
+        if current_time is None:
+            current_time = time.perf_counter()
+        current_time = int(current_time)
         if current_time >= initial_timer + timer_threshold_seconds:
             return True
         else:
@@ -593,60 +596,60 @@ class NPC(Character):
         elif self.rect.y > self._target_sprite.rect.y:
             self.move_up(self.speed)
 
-        self.compass = self._target_sprite.compass.copy()
+        self.compass.update(self._target_sprite.compass)
 
     def set_state_default(self) -> None:
         """Set state to intermediary state, reset variables."""
-        self._current_state = self._states.Default
+        self._current_state = NPCStates.Default
 
     def set_state_patrol(self) -> None:
         """Set state machine to 'Patrol'."""
-        if self._current_state != self._states.Thrown and not self._states.Charging:
-            self._current_state = self._states.Patrol
+        if self._current_state != NPCStates.Thrown and not NPCStates.Charging:
+            self._current_state = NPCStates.Patrol
 
     def set_state_attack(self) -> None:
         """Set state machine to 'Attack'."""
-        if self._current_state != self._states.Thrown:
-            self._current_state = self._states.Attack
+        if self._current_state != NPCStates.Thrown:
+            self._current_state = NPCStates.Attack
 
     def set_state_flee(self) -> None:
         """Set state machine to 'Flee'."""
         if (
-            self._current_state != self._states.Throw_Windup
-            and self._current_state != self._states.Thrown
+            self._current_state != NPCStates.Throw_Windup
+            and self._current_state != NPCStates.Thrown
         ):
-            self._current_state = self._states.Flee
+            self._current_state = NPCStates.Flee
 
     def set_state_follow(self) -> None:
         """Set state machine to 'Follow'."""
-        if self._current_state != self._states.Thrown:
-            self._current_state = self._states.Follow
+        if self._current_state != NPCStates.Thrown:
+            self._current_state = NPCStates.Follow
 
     def set_state_thrown(self) -> None:
         """Set state machine to 'Thrown'."""
-        if self._current_state == self._states.Throw_Windup:
-            self._current_state = self._states.Thrown
+        if self._current_state == NPCStates.Throw_Windup:
+            self._current_state = NPCStates.Thrown
             # TODO: switch to tiles traveled
             self._last_time_stored = time.perf_counter()
-            self.compass = self._player.compass.copy()
+            self.compass.update(self._player.compass)
 
     def set_state_throw_windup(self) -> None:
         """Begin the windup action before throwing an NPC."""
         if (
-            self._current_state != self._states.Thrown
-            and self._current_state != self._states.Throw_Windup
+            self._current_state != NPCStates.Thrown
+            and self._current_state != NPCStates.Throw_Windup
         ):
-            self._current_state = self._states.Throw_Windup
+            self._current_state = NPCStates.Throw_Windup
 
     def set_state_track(self) -> None:
         """Set state machine to 'Tracking'."""
-        if self._current_state == self._states.Patrol:
-            self._current_state = self._states.Tracking
+        if self._current_state == NPCStates.Patrol:
+            self._current_state = NPCStates.Tracking
 
     def set_state_charge(self) -> None:
         """Set state machine to 'Charge'."""
-        if self._current_state == self._states.Tracking:
-            self._current_state = self._states.Charging
+        if self._current_state == NPCStates.Tracking:
+            self._current_state = NPCStates.Charging
 
     def set_player(self, player: pygame.sprite) -> None:
         """Set the player for the entity to track.
@@ -665,7 +668,7 @@ class NPC(Character):
         ------
         ValueError: Cannot set player consume attribute
         """
-        if self._current_state != self._states.Thrown:
+        if self._current_state != NPCStates.Thrown:
             current_player_action: Actions = self._player.pop_next_player_action()
             if current_player_action == Actions.destroy:
                 self.die()
@@ -751,7 +754,7 @@ class NPC(Character):
         # TODO: time should be retrieved from level_manager
         self._last_time_stored = time.perf_counter()
 
-    def teleport_out_of_sprite(self, collision_rect: pygame.Rect):
+    def teleport_out_of_sprite(self, collision_rect: pygame.Rect, axis: Axis = None):
         """Remove self from the collided sprite's collision bounds.
 
         The NPC version of this method must adjust the compass when moving out
@@ -761,13 +764,16 @@ class NPC(Character):
         ----------
         collision_rect: pygame.Rect
             The hitbox of the sprite that was collided with
+        axis: Axis
+            The further axis to the collided sprite, found when not provided
         """
         # check if still within bounds,
         # might not be from prev calls
 
-        axis: str = self.further_axis((collision_rect.centerx, collision_rect.centery))
+        if axis is None:
+            axis = self.further_axis(collision_rect.center)
 
-        if axis == "horizontal":
+        if axis == Axis.horizontal:
             # collided sprite is on the right
             if self._hitbox.centerx < collision_rect.centerx:
                 # teleport to the left
@@ -792,6 +798,14 @@ class NPC(Character):
                     self.move_down()
 
     def flip_current_image(self):
-        """Spin the current image 180 degrees."""
-        spin_angle = 180
-        self.image = pygame.transform.rotate(self.image, spin_angle)
+        """Spin the current image 180 degrees.
+
+        Images are animation frames shared between NPCs, so each frame is only
+        rotated the first time it is flipped.
+        """
+        flipped_image: pygame.Surface = self._flipped_images.get(self.image)
+        if flipped_image is None:
+            spin_angle = 180
+            flipped_image = pygame.transform.rotate(self.image, spin_angle)
+            self._flipped_images[self.image] = flipped_image
+        self.image = flipped_image
@@ -1,14 +1,22 @@
 """This module contains the Character class."""
 import math
 import pygame
+from m1wengine.enums.axis import Axis
 from m1wengine.enums.direction import Direction
 from m1wengine.dict_structures.animation_dict import AnimationDict
+from m1wengine.managers.entity_manager import EntityManager
+from m1wengine.managers.obstacle_manager import ObstacleManager
 from m1wengine.tiles.entities.entity import Entity
 from m1wengine.score_controller import ScoreController
 from m1wengine.tiles.tile import Tile
 
 # number of images for each directional animation
 WALKING_IMAGE_COUNT: int = 3
+# normals used to bounce a compass off horizontal and vertical collisions
+HORIZONTAL_REFLECT_VECTOR: pygame.math.Vector2 = pygame.math.Vector2(Direction.right, 0)
+VERTICAL_REFLECT_VECTOR: pygame.math.Vector2 = pygame.math.Vector2(0, Direction.down)
+# keys of the collision dictionary that hold collided coordinates
+COLLISION_DIRECTION_KEYS: tuple[str, ...] = ("left", "right", "up", "down")
 
 
 class Character(Entity):
@@ -28,6 +36,8 @@ class Character(Entity):
         The sprite group containing all bad sprites
     _good_sprites: pygame.sprite.Group
         The sprite group containing all good sprites
+    _rotated_images: dict[tuple[pygame.Surface, int], pygame.Surface]
+        Each animation image rotated per whole degree so far, shared by every character
 
     Methods
     -------
@@ -43,17 +53,19 @@ class Character(Entity):
         Animation loop for character
     set_status_by_current_rotation(self)
         Set status per current direction
-    get_angle_from_direction(self, axis: str) -> float
+    get_angle_from_direction(self, axis: Axis) -> float
         Get the angle for sprite rotation based on compass direction
     get_distance(self, coords: tuple) -> float
         The hypotenuse of how far away the other character is from this character
+    get_distance_squared(self, coords: tuple) -> int
+        The squared distance of the other character from this character
     set_image_rotation(self, image: pygame.Surface) -> pygame.Surface
         Rotate image per compass direction
     collision_detection(self, sprite_group: pygame.sprite.Group) -> dict
         Get a dictionary of collided sprites.
-    teleport_out_of_sprite(self, collision_rect: pygame.Rect)
+    teleport_out_of_sprite(self, collision_rect: pygame.Rect, axis: Axis = None)
         Move the sprite outside of the collision bounds of a collided sprite
-    further_axis(self, coord: tuple) -> str
+    further_axis(self, coord: tuple) -> Axis
         Find if the given coordinate is further horizontally or vertically
     average_collision_coordinates(self, collision_coordinates: dict) -> tuple
         Get the average coordinates of all collisions from a dictionary of coordinates
@@ -63,6 +75,8 @@ class Character(Entity):
         Bounce a compass off the wall collided with
     """
 
+    _rotated_images: dict[tuple[pygame.Surface, int], pygame.Surface] = {}
+
     def __init__(
         self,
         group: pygame.sprite.Group,
@@ -173,37 +187,26 @@ class Character(Entity):
         This function inspects the current compass direction and determines
         what the status should be.
         """
-        # handle all edge cases first
-        if self.compass.y < 0:
-            self._status = "up"
-        else:
-            self._status = "down"
-
-        if self.compass.x < 0:
+        compass_x: float = self.compass.x
+        compass_y: float = self.compass.y
+        # mostly vertical headings face up or down, everything else faces the
+        # side the compass points to
+        if -0.25 < compass_x < 0.25 and compass_y != 0:
+            self._status = "down" if compass_y > 0 else "up"
+        elif compass_x < 0:
             self._status = "left"
         else:
             self._status = "right"
 
-        # -- xy | xy +-
-        # -+ xy | xy ++
-        if self.compass.x > 0 and self.compass.y < 0.25 and self.compass.y > -0.25:
-            self._status = "right"
-        if self.compass.x < 0 and self.compass.y < 0.25 and self.compass.y > -0.25:
-            self._status = "left"
-        if self.compass.y > 0 and self.compass.x < 0.25 and self.compass.x > -0.25:
-            self._status = "down"
-        if self.compass.y < 0 and self.compass.x < 0.25 and self.compass.x > -0.25:
-            self._status = "up"
-
-    def get_angle_from_direction(self, axis: str) -> float:
+    def get_angle_from_direction(self, axis: Axis) -> float:
         """Get the angle for sprite rotation based on the direction.
 
         Angle returned will need to be inverted for 'down' and 'left'.
 
         Parameters
         ----------
-        axis: str
-            The axis to inspect
+        axis: Axis
+            The axis the status faces along
 
         Returns
         -------
@@ -212,9 +215,9 @@ class Character(Entity):
         """
         angle: float = 0.0
 
-        if axis == "x":
+        if axis == Axis.horizontal:
             angle = self.compass.y * 45
-        if axis == "y":
+        elif axis == Axis.vertical:
             angle = self.compass.x * 45
 
         return angle
@@ -239,12 +242,33 @@ class Character(Entity):
         )
         return hypotenuse
 
+    def get_distance_squared(self, coords: tuple) -> int:
+        """Return the squared distance away from another character.
+
+        Cheaper than get_distance when distances are only compared to each other.
+
+        Parameters
+        ----------
+        coords: tuple
+            The coordinates to compare our position with
+
+        Returns
+        -------
+        distance_squared: int
+            The squared distance the coordinates are from this character
+        """
+        rect: pygame.Rect = self.rect
+        x_distance: int = coords[0] - rect.x
+        y_distance: int = coords[1] - rect.y
+        return x_distance * x_distance + y_distance * y_distance
+
     def set_image_rotation(self, image: pygame.Surface) -> pygame.Surface:
         """Set an image to the correct orietation.
 
         Return the rotated image correlating to the correct rotation.
         Rotation is based on the status, so image rotations are defined by the
-        current status.
+        current status. The angle is rounded to a whole degree so each rotation
+        is only rendered once and then reused.
 
         Parameters
         ----------
@@ -257,17 +281,23 @@ class Character(Entity):
             The rotated image passed into this method
         """
         angle: float = 0.0
-
-        if self._status == "right":
-            angle = -self.get_angle_from_direction("x")
-        if self._status == "left":
-            angle = self.get_angle_from_direction("x")
-        if self._status == "up":
-            angle = -self.get_angle_from_direction("y")
-        if self._status == "down":
-            angle = self.get_angle_from_direction("y")
-
-        rotated_image: pygame.Surface = pygame.transform.rotate(image, angle)
+        # statuses are exclusive, so stop comparing at the first match
+        status: str = self._status
+
+        if status == "right":
+            angle = -self.get_angle_from_direction(Axis.horizontal)
+        elif status == "left":
+            angle = self.get_angle_from_direction(Axis.horizontal)
+        elif status == "up":
+            angle = -self.get_angle_from_direction(Axis.vertical)
+        elif status == "down":
+            angle = self.get_angle_from_direction(Axis.vertical)
+
+        rotation_key: tuple[pygame.Surface, int] = (image, round(angle))
+        rotated_image: pygame.Surface = self._rotated_images.get(rotation_key)
+        if rotated_image is None:
+            rotated_image = pygame.transform.rotate(image, rotation_key[1])
+            self._rotated_images[rotation_key] = rotated_image
         return rotated_image
 
     def collision_detection(
@@ -291,11 +321,15 @@ class Character(Entity):
             All the collision information between this sprite and a group.
         """
         # get list of sprites from the passed in sprite group
-        obstacle_sprites: list = sprite_group.sprites()
-        # extract list of rects from obstacle_sprites
-        sprite_rects: list[pygame.Rect] = list()
-        for sprite in obstacle_sprites:
-            sprite_rects.append(sprite.rect)
+        obstacle_sprites: list
+        if isinstance(sprite_group, ObstacleManager):
+            # only the obstacles near the rect can collide with it
+            obstacle_sprites = sprite_group.candidates(rect_to_test)
+        elif isinstance(sprite_group, EntityManager):
+            # shared list, only rebuilt when the group membership changes
+            obstacle_sprites = sprite_group.sprite_list
+        else:
+            obstacle_sprites = sprite_group.sprites()
 
         # list of all obstacle sprite indicies player has collisions with
         collision_indicies: list[int] = rect_to_test.collidelistall(obstacle_sprites)
@@ -317,42 +351,48 @@ class Character(Entity):
         # if collisions are detected
         if collision_indicies:
             sorted_collisions["collision_detected"] = True
+            # bind the rects once, their values are still read fresh each loop
+            # as teleporting moves this sprite between collisions
+            hitbox: pygame.Rect = self._hitbox
+            further_axis = self.further_axis
+            teleport_out_of_sprite = self.teleport_out_of_sprite
             for collision_index in collision_indicies:
-                collided_sprite: Tile = obstacle_sprites[collision_index]
-                collided_coord: tuple[int, int] = (
-                    collided_sprite._hitbox.centerx,
-                    collided_sprite._hitbox.centery,
-                )
-                # check status then add to appropriate collision direction
-                if self.further_axis(collided_coord) == "vertical":
-                    if collided_sprite._hitbox.centery < self._hitbox.centery:
-                        sorted_collisions["up"].append(collided_coord)
-                    elif collided_sprite._hitbox.centery > self._hitbox.centery:
-                        sorted_collisions["down"].append(collided_coord)
-
-                # if self.status == "left" or self.status == "right":
-                if self.further_axis(collided_coord) == "horizontal":
-                    if collided_sprite._hitbox.centerx < self._hitbox.centerx:
-                        sorted_collisions["left"].append(collided_coord)
-                    elif collided_sprite._hitbox.centerx > self._hitbox.centerx:
-                        sorted_collisions["right"].append(collided_coord)
+                collided_hitbox: pygame.Rect = obstacle_sprites[collision_index]._hitbox
+                collided_coord: tuple[int, int] = collided_hitbox.center
+                # one axis check per collision, shared with the teleport below
+                axis: Axis = further_axis(collided_coord)
+                if axis == Axis.vertical:
+                    if collided_coord[1] < hitbox.centery:
+                        up_coords.append(collided_coord)
+                    elif collided_coord[1] > hitbox.centery:
+                        down_coords.append(collided_coord)
+                else:
+                    if collided_coord[0] < hitbox.centerx:
+                        left_coords.append(collided_coord)
+                    elif collided_coord[0] > hitbox.centerx:
+                        right_coords.append(collided_coord)
 
                 # call method to teleport outside of collision sprite
-                self.teleport_out_of_sprite(collided_sprite._hitbox)
+                teleport_out_of_sprite(collided_hitbox, axis)
 
         return sorted_collisions
 
-    def teleport_out_of_sprite(self, collision_rect: pygame.Rect) -> None:
+    def teleport_out_of_sprite(
+        self, collision_rect: pygame.Rect, axis: Axis = None
+    ) -> None:
         """Remove self from the collided sprite's collision bounds.
 
         Parameters
         ----------
         collision_rect: pygame.Rect
             The hitbox of the sprite that was collided with
+        axis: Axis
+            The further axis to the collided sprite, found when not provided
         """
-        axis: str = self.further_axis((collision_rect.centerx, collision_rect.centery))
+        if axis is None:
+            axis = self.further_axis(collision_rect.center)
 
-        if axis == "horizontal":
+        if axis == Axis.horizontal:
             x_dist_out_hitbox: int = 0
             # collided sprite is on the right
             if self._hitbox.centerx < collision_rect.centerx:
@@ -383,7 +423,7 @@ class Character(Entity):
             if y_dist_out_hitbox != 0:
                 self.rect.move_ip(0, y_dist_out_hitbox)
 
-    def further_axis(self, coord: tuple) -> str:
+    def further_axis(self, coord: tuple) -> Axis:
         """Find the further axis.
 
         Parameters
@@ -393,14 +433,14 @@ class Character(Entity):
 
         Returns
         -------
-        further: str
-            The string of the further axis away from our coords
+        further: Axis
+            The axis along which the coords are further away from us
         """
         distance_to_x: float = abs(self.rect.centerx - coord[0])
         distance_to_y: float = abs(self.rect.centery - coord[1])
-        further: str = "vertical"
+        further: Axis = Axis.vertical
         if distance_to_x > distance_to_y:
-            further = "horizontal"
+            further = Axis.horizontal
         return further
 
     def average_collision_coordinates(self, collision_coordinates: dict) -> tuple:
@@ -419,16 +459,14 @@ class Character(Entity):
         collision_point_x: int = 0
         collision_point_y: int = 0
         count: int = 0
-        for key in collision_coordinates:
-            # meta data starts with 'collision', ignore this
-            if "collision" not in key:
-                coord_tuple_list: list = collision_coordinates[key]
-
-                for coord_tuple in coord_tuple_list:
-                    count += 1
-                    # sum all collision
-                    collision_point_x += coord_tuple[0]
-                    collision_point_y += coord_tuple[1]
+        # only the direction lists hold coordinates, the rest is meta data
+        for key in COLLISION_DIRECTION_KEYS:
+            coord_tuple_list: list = collision_coordinates[key]
+            count += len(coord_tuple_list)
+            for coord_tuple in coord_tuple_list:
+                # sum all collision
+                collision_point_x += coord_tuple[0]
+                collision_point_y += coord_tuple[1]
 
         # divide by number of collisions
         if count != 0:
@@ -461,14 +499,6 @@ class Character(Entity):
         collided_coords: tuple
             A tuple containing the x and y of the average collision point
         """
-        # used to flip x and y by the given amounts in the below vectors
-        horizontal_reflect_vect: pygame.math.Vector2 = pygame.math.Vector2(
-            Direction.right, 0
-        )
-        vertical_reflect_vect: pygame.math.Vector2 = pygame.math.Vector2(
-            0, Direction.down
-        )
-
         abs_distance_to_x: int = abs(self.rect.centerx - collided_coords[0])
         abs_distance_to_y: int = abs(self.rect.centery - collided_coords[1])
         distance_to_x: int = collided_coords[0] - self.rect.centerx
@@ -481,13 +511,13 @@ class Character(Entity):
                 # if compass pointing right
                 if self.compass.x > 0:
                     # bounce the compass off a horizontal vector
-                    self.compass = self.compass.reflect(horizontal_reflect_vect)
+                    self.compass.reflect_ip(HORIZONTAL_REFLECT_VECTOR)
             # if collided with sprite to the left of self
             else:
                 # if compass pointing left
                 if self.compass.x < 0:
                     # bounce the compass off a horizontal vector
-                    self.compass = self.compass.reflect(horizontal_reflect_vect)
+                    self.compass.reflect_ip(HORIZONTAL_REFLECT_VECTOR)
 
         # if up or down
         else:
@@ -496,10 +526,10 @@ class Character(Entity):
                 # if compass pointing up
                 if self.compass.y < 0:
                     # bounce the compass off a vertical vector
-                    self.compass = self.compass.reflect(vertical_reflect_vect)
+                    self.compass.reflect_ip(VERTICAL_REFLECT_VECTOR)
             # if collided with sprite below self
             else:
                 # if compass pointing down
                 if self.compass.y > 0:
                     # bounce the compass off a vertical vector
-                    self.compass = self.compass.reflect(vertical_reflect_vect)
+                    self.compass.reflect_ip(VERTICAL_REFLECT_VECTOR)
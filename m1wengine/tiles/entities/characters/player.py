@@ -9,6 +9,8 @@ from m1wengine.tiles.entities.characters.character import Character
 PLAYER_ROTATION_SPEED = 5
 # Defines how many queue actions there can be at one time
 MAX_ACTION_QUEUE_LENGTH = 3
+# Defines the actions that can be drawn into the action queue
+QUEUE_ACTIONS = (Actions.consume, Actions.destroy, Actions.throw)
 
 
 class Player(Character):
@@ -124,8 +126,7 @@ class Player(Character):
     def ensure_full_action_queue(self) -> None:
         """Fill up the current action queue up to a limit."""
         if len(self._action_queue) < MAX_ACTION_QUEUE_LENGTH:
-            actions = [Actions.consume, Actions.destroy, Actions.throw]
-            self._action_queue.append(random.choice(actions))
+            self._action_queue.append(random.choice(QUEUE_ACTIONS))
 
     def current_action(self) -> Actions:
         """Get the current action.
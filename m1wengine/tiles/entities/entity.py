@@ -21,6 +21,10 @@ class Entity(Tile):
         The dictionary containing all animations for the current direction
     _sprite_sheet: SpriteSheet
         Handler for entire sprite sheet of animation images
+    _sprite_sheet_path: str
+        The filepath where the sprite sheet is stored
+    _loaded_animations: dict[tuple, dict[str, list[pygame.Surface]]]
+        Animations already cut from a sprite sheet, shared by every entity
     _status: str
         The direction a character is facing stored as a string
 
@@ -32,6 +36,8 @@ class Entity(Tile):
         Import sprite animations
     """
 
+    _loaded_animations: dict[tuple, dict[str, list[pygame.Surface]]] = {}
+
     def __init__(
         self,
         group: pygame.sprite.Group,
@@ -57,6 +63,7 @@ class Entity(Tile):
         self._animation_speed: float = 0.15
         self._animations: dict = {}
 
+        self._sprite_sheet_path: str = sprite_sheet_path
         self._sprite_sheet: SpriteSheet = SpriteSheet(
             sprite_sheet_path, pygame.Color("black")
         )
@@ -78,21 +85,39 @@ class Entity(Tile):
         animation_strip: pygame.Surface
             The surface containing the image of the specified rect from the animations
         """
-        animation_strip = self._animations[self._status]
-
-        self._frame_index += self._animation_speed
+        animation_strip: list[pygame.Surface] = self._animations[self._status]
 
-        if self._frame_index >= len(animation_strip):
-            self._frame_index = 0
+        # advance a local copy and store it once
+        frame_index: float = self._frame_index + self._animation_speed
+        if frame_index >= len(animation_strip):
+            frame_index = 0
+        self._frame_index = frame_index
 
-        return animation_strip[int(self._frame_index)]
+        return animation_strip[int(frame_index)]
 
     def import_assets(self) -> None:
         """Import and divide the animation image into it's smaller parts.
 
         Import all Entity animations according to the animation dictionary passed in.
+        Frames are only read from, so entities cut from the same sheet with the
+        same animations share one set of frames.
         """
-        for animation in self._animation_dict:
-            self._animations[animation["name"]] = self._sprite_sheet.load_strip(
-                animation["image_rect"], animation["image_count"]
+        animation_key: tuple = (self._sprite_sheet_path,) + tuple(
+            (
+                animation["name"],
+                tuple(animation["image_rect"]),
+                animation["image_count"],
             )
+            for animation in self._animation_dict
+        )
+        animations: dict[str, list[pygame.Surface]] = self._loaded_animations.get(
+            animation_key
+        )
+        if animations is None:
+            animations = {}
+            for animation in self._animation_dict:
+                animations[animation["name"]] = self._sprite_sheet.load_strip(
+                    animation["image_rect"], animation["image_count"]
+                )
+            self._loaded_animations[animation_key] = animations
+        self._animations = animations
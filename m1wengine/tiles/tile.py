@@ -156,24 +156,35 @@ class Tile(pygame.sprite.Sprite):
         # move each time a tracker is 1 or -1 and then reset the tracker
         self.update_movement_tracker()
 
-        up: Direction = Direction.up
-        down: Direction = Direction.down
-        left: Direction = Direction.left
-        right: Direction = Direction.right
-
-        if self._movement_tracker["vertical"] <= up:
-            self._move_up(speed)
-            self._movement_tracker["vertical"] += down
-        elif self._movement_tracker["vertical"] >= down:
-            self._move_down(speed)
-            self._movement_tracker["vertical"] += up
-
-        if self._movement_tracker["horizontal"] <= left:
-            self._move_left(speed)
-            self._movement_tracker["horizontal"] += right
-        elif self._movement_tracker["horizontal"] >= right:
-            self._move_right(speed)
-            self._movement_tracker["horizontal"] += left
+        movement_tracker: dict[str, float] = self._movement_tracker
+        vertical: float = movement_tracker["vertical"]
+        horizontal: float = movement_tracker["horizontal"]
+        move_pixels_x: int = 0
+        move_pixels_y: int = 0
+        moved: bool = False
+
+        # speed is refined once per axis moved, vertical first
+        if vertical <= Direction.up:
+            move_pixels_y = -self.refine_speed(speed)
+            movement_tracker["vertical"] = vertical + Direction.down
+            moved = True
+        elif vertical >= Direction.down:
+            move_pixels_y = self.refine_speed(speed)
+            movement_tracker["vertical"] = vertical + Direction.up
+            moved = True
+
+        if horizontal <= Direction.left:
+            move_pixels_x = -self.refine_speed(speed)
+            movement_tracker["horizontal"] = horizontal + Direction.right
+            moved = True
+        elif horizontal >= Direction.right:
+            move_pixels_x = self.refine_speed(speed)
+            movement_tracker["horizontal"] = horizontal + Direction.left
+            moved = True
+
+        # both axes are applied with a single rect move
+        if moved:
+            self.move_and_update_hitbox((move_pixels_x, move_pixels_y))
 
     def move_right(self, speed: int = DEFAULT_SPEED) -> None:
         """Move to the right.
@@ -271,8 +282,7 @@ class Tile(pygame.sprite.Sprite):
         speed = self.refine_speed(speed)
         move_pixels_x: int = -1 * speed
         move_pixels_y: int = 0
-        move_tuple: pygame.Vector2 = pygame.Vector2(move_pixels_x, move_pixels_y)
-        self.move_and_update_hitbox(move_tuple)
+        self.move_and_update_hitbox((move_pixels_x, move_pixels_y))
 
     def _move_right(self, speed: int) -> None:
         """Move to the right.
@@ -285,8 +295,7 @@ class Tile(pygame.sprite.Sprite):
         speed = self.refine_speed(speed)
         move_pixels_x: int = speed
         move_pixels_y: int = 0
-        move_tuple: pygame.Vector2 = pygame.Vector2(move_pixels_x, move_pixels_y)
-        self.move_and_update_hitbox(move_tuple)
+        self.move_and_update_hitbox((move_pixels_x, move_pixels_y))
 
     def _move_up(self, speed: int) -> None:
         """Move up.
@@ -299,8 +308,7 @@ class Tile(pygame.sprite.Sprite):
         speed = self.refine_speed(speed)
         move_pixels_x: int = 0
         move_pixels_y: int = -1 * speed
-        move_tuple: pygame.Vector2 = pygame.Vector2(move_pixels_x, move_pixels_y)
-        self.move_and_update_hitbox(move_tuple)
+        self.move_and_update_hitbox((move_pixels_x, move_pixels_y))
 
     def _move_down(self, speed: int) -> None:
         """Move down.
@@ -313,8 +321,7 @@ class Tile(pygame.sprite.Sprite):
         speed = self.refine_speed(speed)
         move_pixels_x: int = 0
         move_pixels_y: int = speed
-        move_tuple: pygame.Vector2 = pygame.Vector2(move_pixels_x, move_pixels_y)
-        self.move_and_update_hitbox(move_tuple)
+        self.move_and_update_hitbox((move_pixels_x, move_pixels_y))
 
     def refine_speed(self, speed: int) -> int:
         """Reduce speed by factor of 10 and save remainder.
@@ -339,13 +346,20 @@ class Tile(pygame.sprite.Sprite):
         speed = int(speed + self._move_remainder)
         return speed
 
-    def move_and_update_hitbox(self, move_coordinates: pygame.Vector2) -> None:
+    def move_and_update_hitbox(self, move_coordinates: tuple[int, int]) -> None:
         """Move tile by x, y pixels and update hitbox.
 
         Parameters
         ----------
-        move_coordinates: pygame.Vector2
+        move_coordinates: tuple[int, int]
             The number of x and y pixels to move.
         """
-        self.rect.move_ip(move_coordinates)
-        self._hitbox.center = self.rect.center
+        # called for every camera sprite each frame, so skip the rect property
+        rect: pygame.Rect = self._rect
+        rect.move_ip(move_coordinates)
+        hitbox: pygame.Rect = self._hitbox
+        # background tiles use their rect as the hitbox, already moved above
+        if hitbox is not rect:
+            # copy each axis directly rather than through a center tuple
+            hitbox.centerx = rect.centerx
+            hitbox.centery = rect.centery
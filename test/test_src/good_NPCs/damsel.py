@@ -77,10 +77,13 @@ class Damsel(NPC):
     def collision_handler(self) -> None:
         """Handle collision interactions with the environment and other entities."""
         super().collision_handler()
-        enemy_sprites: list = self._bad_sprites.sprites()
-        collisions: list[int] = self.rect.collidelistall(enemy_sprites)
+        # enemies touching the damsel are always inside the radar scanned this
+        # frame, so only those need checking
+        enemy_sprites: list = self._radar_sprites
+        # any single enemy hit is fatal, so stop at the first one found
+        first_collision: int = self.rect.collidelist(enemy_sprites)
 
-        if collisions:
+        if first_collision != -1:
             self.die()
 
     def die(self) -> None:
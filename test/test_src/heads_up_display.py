@@ -29,6 +29,10 @@ class HeadsUpDisplay(AbstractHud):
         Contains the current score sprite
     _boredom_meter: pygame.sprite.Sprite
         Contains the boredom meter sprite
+    _last_score: int
+        The score currently rendered in the current score sprite
+    _last_boredom: int
+        The boredom currently rendered in the boredom meter sprite
 
     Methods
     -------
@@ -64,6 +68,9 @@ class HeadsUpDisplay(AbstractHud):
         )
         self._current_score: Text = score_sprites[1]
         self._boredom_meter: Text = score_sprites[2]
+        # force the first update to render the starting values
+        self._last_score: int = -1
+        self._last_boredom: int = -1
 
         for sprite in score_sprites:
             self.add(sprite)
@@ -88,10 +95,14 @@ class HeadsUpDisplay(AbstractHud):
     def update(self) -> None:
         """Run the HUD."""
         super().update()
-        self._current_score.text_string: str = "Current Score: " + str(
-            self._score_controller.current_score
-        )
-        self._boredom_meter.text_string: str = "Boredom Meter: " + str(
-            self._score_controller.current_score
-        )
+        # only re-render score text when the underlying value changes
+        current_score: int = self._score_controller.current_score
+        if current_score != self._last_score:
+            self._current_score.text_string = "Current Score: " + str(current_score)
+            self._last_score = current_score
+
+        boredom: int = self._score_controller.boredom_meter
+        if boredom != self._last_boredom:
+            self._boredom_meter.text_string = "Boredom Meter: " + str(boredom)
+            self._last_boredom = boredom
         self.attempt_level_hint_display()
@@ -1,6 +1,8 @@
 """This module contains the Level class."""
 import pygame
 from m1wengine.managers.camera_manager import CameraManager
+from m1wengine.managers.entity_manager import EntityManager
+from m1wengine.managers.obstacle_manager import ObstacleManager
 from m1wengine.tiles.tile import Tile
 from m1wengine.file_managers.support import import_csv_layout
 from m1wengine.settings import TILESIZE
@@ -33,13 +35,13 @@ class Level(object):
         The sprite group containing all the fence sprites
     _extra_sprites: pygame.sprite.Group
         The sprite group containing all the extra sprites
-    _obstacle_sprites: pygame.sprite.Group
+    _obstacle_sprites: ObstacleManager
         The sprites group containing all sprites that Characters cannot move through
-    _bad_sprites: pygame.sprite.Group
+    _bad_sprites: EntityManager
         The sprite group for all bad aligned sprites
-    _good_sprites: pygame.sprite.Group
+    _good_sprites: EntityManager
         The sprite group for all good aligned sprites
-    _neutral_sprites: pygame.sprite.Group
+    _neutral_sprites: EntityManager
         The sprite group for all neutral aligned sprites
     _attack_sprites: pygame.sprite.Group
         The sprites group used for projectiles made from attacks
@@ -152,10 +154,10 @@ class Level(object):
 
     def create_sprite_groups(self) -> None:
         """Create all sprite groups for the level."""
-        self._obstacle_sprites = pygame.sprite.Group()
-        self._bad_sprites = pygame.sprite.Group()
-        self._good_sprites = pygame.sprite.Group()
-        self._neutral_sprites = pygame.sprite.Group()
+        self._obstacle_sprites = ObstacleManager()
+        self._bad_sprites = EntityManager()
+        self._good_sprites = EntityManager()
+        self._neutral_sprites = EntityManager()
         self._attack_sprites = pygame.sprite.Group()
         self._player_group = pygame.sprite.GroupSingle()
         self._item_sprites = pygame.sprite.Group()
@@ -260,7 +262,8 @@ class Level(object):
 
     def add_sprites_to_camera(self) -> None:
         """Add all visible sprites to the CameraManager."""
-        self._camera.add(self._terrain_sprites)
+        # terrain never changes, so it is drawn as one pre-rendered layer
+        self._camera.add_static(self._terrain_sprites)
         self._camera.add(self._plant_sprites)
         self._camera.add(self._fence_sprites)
         self._camera.add(self._extra_sprites)